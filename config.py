@@ -1,5 +1,7 @@
 # Configuration for CHEF COMPENSWISS Data Scraper
 
+from types import MappingProxyType
+
 # Base URL
 BASE_URL = "https://ar.compenswiss.ch"
 
@@ -15,13 +17,16 @@ SELENIUM_PAGE_LOAD_TIMEOUT = 30
 # Runtime settings
 HEADLESS = True  # Set to False to see the browser
 YEAR = "latest"  # Set to specific year (e.g., 2024) or "latest" to use current year
+VERBOSE = False  # Set to True to print every extracted value (missing values are always printed)
+KEEP_BROWSER_OPEN = False  # Set to True to reuse the Chrome session across runs in the same process
 
 # Dataset settings
 DATASET_NAME = "CHEF_COMPENSWISS"  # Used in file naming
+OUTPUT_FORMAT = "xlsx"  # "xlsx" (runbook .xls files) or "csv" for plain CSV DATA/META files
 
 
-# CSV Column Headers (exact order from sample data)
-CSV_HEADERS = [
+# CSV Column Headers (exact order from sample data, read-only)
+CSV_HEADERS = (
     "",
     "COMPENSWISS.MONEYMARKET.LEVEL.NONE.A.1@COMPENSWISS",
     "COMPENSWISS.LOANS.LEVEL.NONE.A.1@COMPENSWISS",
@@ -55,10 +60,10 @@ CSV_HEADERS = [
     "COMPENSWISS.DOMESTICBONDSLOCALFX.TARGETALLOCATION.NONE.A.1@COMPENSWISS",
     "COMPENSWISS.REALESTATE.TARGETALLOCATION.NONE.A.1@COMPENSWISS",
     "COMPENSWISS.PRECIOUSMETALS.TARGETALLOCATION.NONE.A.1@COMPENSWISS",
-]
+)
 
-# CSV Row 2 Headers (descriptive names)
-CSV_ROW2_HEADERS = [
+# CSV Row 2 Headers (descriptive names, read-only)
+CSV_ROW2_HEADERS = (
     "",
     "Detailed investment perfomance, Money market investment, Amount",
     "Detailed investment perfomance, Loans, Amount",
@@ -92,7 +97,7 @@ CSV_ROW2_HEADERS = [
     "Structure of the strategic allocation, Bonds in CHF",
     "Structure of the strategic allocation, Real Estate",
     "Structure of the strategic allocation, Precious Metals",
-]
+)
 
 # Mapping table categories to CSV column indices
 PERFORMANCE_TABLE_MAPPING = {
@@ -123,8 +128,12 @@ PERFORMANCE_TABLE_MAPPING = {
     "Basic portfolio - Treasury": 27,
 }
 
-# Metadata template - common fields for all rows
-METADATA_COMMON = {
+# Minimum difflib similarity (0-1) for reporting an unmapped table category as similar to a mapping key
+# (reported only: the amount is not written to that column)
+CATEGORY_MATCH_CUTOFF = 0.9
+
+# Metadata template - common fields for all rows (read-only mappings)
+METADATA_COMMON = MappingProxyType({
     "FREQUENCY": "A",
     "AGGREGATION_TYPE": "UNDEFINED",
     "SEASONALLY_ADJUSTED": "NSA",
@@ -135,25 +144,29 @@ METADATA_COMMON = {
     "SOURCE_DESCRIPTION": "Compenswiss - Fonds de compensation AVS",
     "COUNTRY": "CHE",
     "DATASET": "CHEF"
-}
+})
 
 # Metadata for performance data (columns 1-27)
-METADATA_PERFORMANCE = {
+METADATA_PERFORMANCE = MappingProxyType({
     "MULTIPLIER": 6,
     "UNIT_TYPE": "FLOW",
     "DATA_TYPE": "CURRENCY",
     "DATA_UNIT": "CHF",
     "PROVIDER_MEASURE_URL": f"{BASE_URL}/en_GB/investments"
-}
+})
 
 # Metadata for strategic allocation data (columns 28-32)
-METADATA_STRATEGIC = {
+METADATA_STRATEGIC = MappingProxyType({
     "MULTIPLIER": 0,
     "UNIT_TYPE": "LEVEL",
     "DATA_TYPE": "PERCENT",
     "DATA_UNIT": "PERCENT",
     "PROVIDER_MEASURE_URL": f"{BASE_URL}/en_GB/investments/strategic-asset-allocation-sva"
-}
+})
+
+# Shared pattern fragments: optional approximation word, captured percentage value
+PATTERN_APPROX = r"(?: approximately| roughly| about)?"
+PATTERN_PERCENT = r"(\d+(?:\.\d+)?)%"
 
 # Strategic Allocation Extraction Configuration
 # Hybrid strategy: specific patterns + sentence-based fallback with proximity check
@@ -163,44 +176,44 @@ STRATEGIC_ALLOCATION_CONFIG = {
     "Foreign currency bonds": {
         "keywords": ["foreign currency bond", "foreign bond"],
         "patterns": [
-            r"Foreign currency bonds? (?:account for|represent|comprise|are)(?: approximately| roughly| about)? (\d+(?:\.\d+)?)%",
-            r"(\d+(?:\.\d+)?)% (?:of |in )?foreign currency bonds?",
+            r"Foreign currency bonds? (?:account for|represent|comprise|are)" + PATTERN_APPROX + " " + PATTERN_PERCENT,
+            PATTERN_PERCENT + r" (?:of |in )?foreign currency bonds?",
         ],
         "column": 28,
     },
     "Equities": {
         "keywords": ["equit"],
         "patterns": [
-            r"Equit(?:y|ies) (?:account for|represent|comprise)(?: approximately| roughly| about)? (\d+(?:\.\d+)?)%",
-            r"(\d+(?:\.\d+)?)%.*?equit(?:y|ies)",
+            r"Equit(?:y|ies) (?:account for|represent|comprise)" + PATTERN_APPROX + " " + PATTERN_PERCENT,
+            PATTERN_PERCENT + r".*?equit(?:y|ies)",
         ],
         "column": 29,
     },
     "Bonds in CHF": {
         "keywords": ["denominated in", "CHF", "swiss franc"],
         "patterns": [
-            r"denominated in (?:Swiss )?(?:francs? )?\(CHF\) (?:account for|represent|make up)(?: approximately| roughly| about)? (\d+(?:\.\d+)?)%",
-            r"denominated in (?:Swiss )?CHF (?:account for|represent|make up)(?: approximately| roughly| about)? (\d+(?:\.\d+)?)%",
-            r"Bonds.*?CHF.*?(\d+(?:\.\d+)?)%",
-            r"CHF.*?(\d+(?:\.\d+)?)%",
+            r"denominated in (?:Swiss )?(?:francs? )?\(CHF\) (?:account for|represent|make up)" + PATTERN_APPROX + " " + PATTERN_PERCENT,
+            r"denominated in (?:Swiss )?CHF (?:account for|represent|make up)" + PATTERN_APPROX + " " + PATTERN_PERCENT,
+            r"Bonds.*?CHF.*?" + PATTERN_PERCENT,
+            r"CHF.*?" + PATTERN_PERCENT,
         ],
         "column": 30,
     },
     "Real estate": {
         "keywords": ["real[- ]estate", "property"],
         "patterns": [
-            r"Real[- ]estate,? which (?:accounts? for|represent|comprise)(?: approximately| roughly| about)? (\d+(?:\.\d+)?)%",
-            r"Real[- ]estate.*?(?:accounts? for|represent|comprise)(?: approximately| roughly| about)? (\d+(?:\.\d+)?)%",
-            r"(\d+(?:\.\d+)?)%.*?real[- ]estate",
+            r"Real[- ]estate,? which (?:accounts? for|represent|comprise)" + PATTERN_APPROX + " " + PATTERN_PERCENT,
+            r"Real[- ]estate.*?(?:accounts? for|represent|comprise)" + PATTERN_APPROX + " " + PATTERN_PERCENT,
+            PATTERN_PERCENT + r".*?real[- ]estate",
         ],
         "column": 31,
     },
     "Precious metals": {
         "keywords": ["precious metal", "gold"],
         "patterns": [
-            r"(?:invest|hold)s?.*?(\d+(?:\.\d+)?)% (?:in |of )?precious metals?",
-            r"precious metals?.*?(\d+(?:\.\d+)?)%",
-            r"(\d+(?:\.\d+)?)% (?:in |of )?precious metals?",
+            r"(?:invest|hold)s?.*?" + PATTERN_PERCENT + r" (?:in |of )?precious metals?",
+            r"precious metals?.*?" + PATTERN_PERCENT,
+            PATTERN_PERCENT + r" (?:in |of )?precious metals?",
         ],
         "column": 32,
     },
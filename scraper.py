@@ -9,25 +9,209 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import WebDriverException
+from lxml import etree, html as lxml_html
+from openpyxl import Workbook
 import pandas as pd
 import re
 import time
+import csv
 import datetime
+import difflib
+import functools
+import io
 import os
 import shutil
 import zipfile
 import config
 
 
+# Flags for the strategic allocation regexes: the page text is English, so \d and case folding
+# are limited to ASCII (the sentence splitter keeps Unicode \s to split on non-breaking spaces)
+STRATEGIC_REGEX_FLAGS = re.IGNORECASE | re.ASCII
+
+# Characters with a special meaning in regex patterns
+REGEX_METACHARS = frozenset('.^$*+?{}[]\\|()')
+REGEX_QUANTIFIERS = frozenset('*+?{')
+
+
+def _has_top_level_alternation(pattern):
+    """True if the pattern has a | outside any group or character class (e.g. "a%|b")"""
+    depth = 0
+    in_class = False
+    escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+    return False
+
+
+def _literal_prefix(pattern):
+    """Lowercase literal text every match of the pattern starts with ("" if there is none)"""
+    # With a top-level alternation, a match may start with any of the alternatives
+    if _has_top_level_alternation(pattern):
+        return ""
+    prefix_length = 0
+    while prefix_length < len(pattern) and pattern[prefix_length] not in REGEX_METACHARS:
+        prefix_length += 1
+    # A quantifier makes the character before it optional
+    if prefix_length < len(pattern) and pattern[prefix_length] in REGEX_QUANTIFIERS:
+        prefix_length = max(prefix_length - 1, 0)
+    return pattern[:prefix_length].lower()
+
+
+# Strategic allocation patterns compiled once at import, as (literal prefix, compiled pattern):
+# a pattern whose prefix is not in the lowercased text cannot match and is skipped
+STRATEGIC_PATTERNS = {
+    asset_name: [
+        (_literal_prefix(pattern), re.compile(pattern, STRATEGIC_REGEX_FLAGS))
+        for pattern in asset_config["patterns"]
+    ]
+    for asset_name, asset_config in config.STRATEGIC_ALLOCATION_CONFIG.items()
+}
+
+
+def _compile_keyword(keyword):
+    """Plain-text keywords become lowercase strings (matched with str.find), the rest are compiled"""
+    if REGEX_METACHARS.isdisjoint(keyword):
+        return keyword.lower()
+    return re.compile(keyword, STRATEGIC_REGEX_FLAGS)
+
+
+STRATEGIC_KEYWORDS = {
+    asset_name: [_compile_keyword(keyword) for keyword in asset_config["keywords"]]
+    for asset_name, asset_config in config.STRATEGIC_ALLOCATION_CONFIG.items()
+}
+
+# Sentence boundary (period followed by whitespace or end of text) and percentage value
+SENTENCE_SPLIT_RE = re.compile(r'\.(?:\s|$)')
+PERCENT_RE = re.compile(config.PATTERN_PERCENT, re.ASCII)
+
+# Maximum number of words allowed between a keyword and its percentage
+PROXIMITY_MAX_WORDS = 15
+
+# Columns shown by display_summary, as (label, CSV column index)
+SUMMARY_PERFORMANCE_COLUMNS = (
+    ("Money market investments", 1),
+    ("Swiss francs bonds", 3),
+    ("Foreign currency bonds", 4),
+    ("Equities", 11),
+    ("Real estate", 15),
+    ("Gold", 20),
+    ("Market portfolio", 22),
+    ("Currency hedging", 23),
+    ("Market portfolio after hedging", 26),
+)
+SUMMARY_STRATEGIC_COLUMNS = (
+    ("Foreign currency bonds", 28),
+    ("Equities", 29),
+    ("Bonds in CHF", 30),
+    ("Real estate", 31),
+    ("Precious metals", 32),
+)
+
+# Characters removed from table amounts (thousands separators), e.g. "43\xa0948" -> "43948"
+AMOUNT_STRIP_TABLE = str.maketrans('', '', '\xa0 ,')
+
+
+def _normalize_category(name):
+    """Category name without case, extra spaces, trailing ":" or plural "s", for matching"""
+    words = name.strip().rstrip(':').casefold().split()
+    return " ".join(word[:-1] if word.endswith('s') else word for word in words)
+
+
+def _publish_file(src, dst):
+    """Put src at dst as a hard link (no bytes copied), falling back to a copy"""
+    try:
+        os.remove(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Different volume or a file system without hard links
+        shutil.copy2(src, dst)
+
+
+def _quit_driver(driver):
+    """Quit a WebDriver, ignoring errors from a session that is already gone"""
+    try:
+        driver.quit()
+    except WebDriverException:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _build_metadata_frame():
+    """METADATA table for config.CSV_HEADERS; only depends on read-only config values"""
+    # One entry per column (1-32, skipping column 0 which is the year)
+    codes = config.CSV_HEADERS[1:]
+    descriptions = config.CSV_ROW2_HEADERS[1:]
+
+    # Code mnemonic: everything before @, with the .A.1 suffix removed if present
+    code_mnemonics = [code.partition('@')[0] for code in codes]
+    code_mnemonics = [code[:-4] if code.endswith('.A.1') else code for code in code_mnemonics]
+
+    # Performance data (columns 1-27) or strategic allocation (columns 28-32)
+    metadata_types = [
+        config.METADATA_PERFORMANCE if col_idx <= 27 else config.METADATA_STRATEGIC
+        for col_idx in range(1, len(codes) + 1)
+    ]
+
+    def per_type(field):
+        return [metadata_type[field] for metadata_type in metadata_types]
+
+    # Build the table column by column; constant fields are broadcast by pandas
+    common = config.METADATA_COMMON
+    return pd.DataFrame({
+        "CODE": codes,
+        "CODE_MNEMONIC": code_mnemonics,
+        "DESCRIPTION": descriptions,
+        "FREQUENCY": common["FREQUENCY"],
+        "MULTIPLIER": per_type("MULTIPLIER"),
+        "AGGREGATION_TYPE": common["AGGREGATION_TYPE"],
+        "UNIT_TYPE": per_type("UNIT_TYPE"),
+        "DATA_TYPE": per_type("DATA_TYPE"),
+        "DATA_UNIT": per_type("DATA_UNIT"),
+        "SEASONALLY_ADJUSTED": common["SEASONALLY_ADJUSTED"],
+        "ANNUALIZED": common["ANNUALIZED"],
+        "STATE": common["STATE"],
+        "PROVIDER_MEASURE_URL": per_type("PROVIDER_MEASURE_URL"),
+        "PROVIDER": common["PROVIDER"],
+        "SOURCE": common["SOURCE"],
+        "SOURCE_DESCRIPTION": common["SOURCE_DESCRIPTION"],
+        "COUNTRY": common["COUNTRY"],
+        "DATASET": common["DATASET"],
+    })
+
+
 class CompensswissScraper:
     """Main scraper for CHEF COMPENSWISS data extraction"""
 
-    def __init__(self, headless=None, year=None):
+    # Chrome session kept open by close() when keep_alive is set, reused by the next setup_driver()
+    # with the same headless setting
+    _cached_driver = None
+    _cached_headless = None
+
+    def __init__(self, headless=None, year=None, keep_alive=None, verbose=None):
         self.driver = None
         # Use config settings if not specified
         self.headless = headless if headless is not None else config.HEADLESS
         self.year = year if year else config.YEAR
+        self.keep_alive = keep_alive if keep_alive is not None else config.KEEP_BROWSER_OPEN
+        self.verbose = verbose if verbose is not None else config.VERBOSE
         self.performance_data = {}
         self.strategic_data = {}
         self.csv_row = ["NA"] * 33
@@ -35,6 +219,20 @@ class CompensswissScraper:
     def setup_driver(self):
         """Setup Chrome WebDriver"""
         print("\n[1] Setting up Chrome driver...")
+        cached_driver = CompensswissScraper._cached_driver
+        if self.keep_alive and cached_driver is not None:
+            CompensswissScraper._cached_driver = None
+            if CompensswissScraper._cached_headless == self.headless:
+                # Reuse the browser left open by a previous run, starting from a clean session
+                try:
+                    cached_driver.delete_all_cookies()
+                    self.driver = cached_driver
+                    print("[OK] Chrome driver ready (reused)")
+                    return
+                except WebDriverException:
+                    print("    Kept browser is no longer responding, starting a new one")
+            _quit_driver(cached_driver)
+
         chrome_options = Options()
         if self.headless:
             chrome_options.add_argument("--headless")
@@ -59,45 +257,45 @@ class CompensswissScraper:
         wait.until(EC.presence_of_element_located((By.CLASS_NAME, "table--chart")))
         print("[OK] Page loaded")
 
-        # Get page source and parse
-        html = self.driver.page_source
-        soup = BeautifulSoup(html, 'html.parser')
+        # Get page source and parse (the source string is not kept, so it is freed once parsed)
+        tree = lxml_html.fromstring(self.driver.page_source)
 
         # Find the performance table
-        table = soup.find('table', class_='table--chart')
-        if not table:
+        tables = tree.xpath("//table[contains(concat(' ', normalize-space(@class), ' '), ' table--chart ')]")
+        if not tables:
             raise Exception("Performance table not found")
+        table = tables[0]
+
+        # Remove superscript tags (footnote markers) from the whole table at once
+        etree.strip_elements(table, 'sup', with_tail=False)
 
-        tbody = table.find('tbody')
-        rows = tbody.find_all('tr')
+        rows = table.xpath('./tbody/tr')
         print("[OK] Found {} rows in table".format(len(rows)))
 
-        # Extract data from each row
-        for row in rows:
-            cells = row.find_all('td')
-            if len(cells) < 2:
-                continue
+        # Category (1st column) and amount (2nd column) cells of every row with at least 2 cells
+        cells = table.xpath('./tbody/tr[td[2]]/td[position() <= 2]')
 
-            # Get category name - remove superscript tags first
-            category_cell_clean = cells[0]
-            for sup in category_cell_clean.find_all('sup'):
-                sup.decompose()  # Remove superscript tags
-            category = category_cell_clean.get_text(strip=True)
+        # Extract data from each row (per-row lines are printed once after the loop)
+        row_lines = []
+        for category_cell, amount_cell in zip(cells[0::2], cells[1::2]):
+            category = category_cell.text_content().strip()
             if not category:
                 continue
 
-            # Get amount (2nd column)
-            amount_text = cells[1].get_text(strip=True)
+            amount_text = amount_cell.text_content().strip()
             if not amount_text:
                 continue
 
             # Clean amount
-            amount = amount_text.replace('\xa0', '').replace(' ', '').replace(',', '')
+            amount = amount_text.translate(AMOUNT_STRIP_TABLE)
 
             # Store
             self.performance_data[category] = amount
-            print("    {} = {}".format(category[:40], amount))
+            if self.verbose:
+                row_lines.append("    {} = {}".format(category[:40], amount))
 
+        if row_lines:
+            print("\n".join(row_lines))
         print("[OK] Extracted {} performance data points".format(len(self.performance_data)))
 
         # Map to CSV columns
@@ -107,12 +305,47 @@ class CompensswissScraper:
         """Map performance data to CSV columns using config mapping"""
         print("\n[3] Mapping performance data to CSV columns...")
 
-        for category, col_index in config.PERFORMANCE_TABLE_MAPPING.items():
-            if category in self.performance_data:
+        mapping = config.PERFORMANCE_TABLE_MAPPING
+
+        # Walk the scraped rows and look each category up in the mapping
+        col_lines = []
+        unmatched = []
+        for category, amount in self.performance_data.items():
+            col_index = mapping.get(category)
+            if col_index is None:
+                unmatched.append(category)
+                continue
+            self.csv_row[col_index] = amount
+            if self.verbose:
+                col_lines.append("    Col[{}] = {}".format(col_index, amount))
+
+        # Match category names that only differ in case, spacing, a trailing ":" or a plural "s" to
+        # unused mapping keys; other near misses are only reported, since similar names can be
+        # different categories (e.g. "Global listed" / "Global unlisted")
+        missing = mapping.keys() - self.performance_data.keys()
+        missing_by_name = {_normalize_category(key): key for key in missing}
+        for category in unmatched:
+            key = missing_by_name.pop(_normalize_category(category), None)
+            if key is not None:
+                missing.discard(key)
+                col_index = mapping[key]
                 self.csv_row[col_index] = self.performance_data[category]
-                print("    Col[{}] = {}".format(col_index, self.performance_data[category]))
-            else:
-                print("    Col[{}] = NOT FOUND (kept as NA)".format(col_index))
+                col_lines.append("    Col[{}] = {} (matched '{}' -> '{}')".format(
+                    col_index, self.performance_data[category], category, key
+                ))
+                continue
+            close = difflib.get_close_matches(category, sorted(missing), n=1, cutoff=config.CATEGORY_MATCH_CUTOFF)
+            if close:
+                col_lines.append("    '{}' not mapped (similar to '{}', Col[{}] not filled)".format(
+                    category, close[0], mapping[close[0]]
+                ))
+
+        # Report mapped categories that were not in the table
+        for category in sorted(missing, key=mapping.get):
+            col_lines.append("    Col[{}] = NOT FOUND (kept as NA)".format(mapping[category]))
+
+        if col_lines:
+            print("\n".join(col_lines))
 
         print("[OK] Performance data mapped")
 
@@ -129,33 +362,30 @@ class CompensswissScraper:
         wait.until(EC.presence_of_element_located((By.XPATH, "//h3[contains(text(), 'Structure of the strategic allocation')]")))
         print("[OK] Page loaded")
 
-        # Get page source and parse
-        html = self.driver.page_source
-        soup = BeautifulSoup(html, 'html.parser')
+        # Get page source and parse (the source string is not kept, so it is freed once parsed)
+        tree = lxml_html.fromstring(self.driver.page_source)
 
         # Find the section
-        heading = soup.find('h3', string=re.compile(r'Structure of the strategic allocation', re.IGNORECASE))
-        if not heading:
+        headings = tree.xpath(
+            "//h3[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), "
+            "'structure of the strategic allocation')]"
+        )
+        if not headings:
             # Try finding by ID
-            anchor = soup.find('a', id='a4')
-            if anchor:
-                heading = anchor.find_parent('h3')
+            headings = tree.xpath("//a[@id='a4']/ancestor::h3[1]")
 
-        if not heading:
+        if not headings:
             raise Exception("Strategic allocation section not found")
+        heading = headings[0]
 
-        # Get paragraphs after heading
-        paragraphs = []
-        current = heading.find_next_sibling()
-
-        while current:
-            if current.name == 'p':
-                text = current.get_text(strip=True)
-                if text:
-                    paragraphs.append(text)
-            elif current.name in ['h2', 'h3', 'h4']:
-                break
-            current = current.find_next_sibling()
+        # Get paragraphs after heading, up to the next h2/h3/h4, in a single XPath:
+        # a following <p> is in the section if exactly one more heading precedes it than precedes the heading
+        section_number = int(heading.xpath("count(preceding-sibling::h2 | preceding-sibling::h3 | preceding-sibling::h4)")) + 1
+        section_paragraphs = heading.xpath(
+            "following-sibling::p[count(preceding-sibling::h2 | preceding-sibling::h3 | preceding-sibling::h4) = $n]",
+            n=section_number
+        )
+        paragraphs = [text for text in (p.text_content().strip() for p in section_paragraphs) if text]
 
         full_text = " ".join(paragraphs)
         print("[OK] Extracted text ({} characters)".format(len(full_text)))
@@ -182,33 +412,48 @@ class CompensswissScraper:
         """
         print("\n[5] Extracting strategic allocation percentages (hybrid strategy)...")
 
+        # Split into sentences once for all assets (periods only, newlines stay part of sentences),
+        # lowercased so plain-text keywords can be found with str.find
+        text_lower = text.lower()
+        sentences = [sentence.lower() for sentence in SENTENCE_SPLIT_RE.split(text)]
+
+        asset_lines = []
         for asset_name, asset_config in config.STRATEGIC_ALLOCATION_CONFIG.items():
             value, method = self._extract_hybrid(
                 text,
-                asset_config["keywords"],
-                asset_config["patterns"]
+                text_lower,
+                sentences,
+                STRATEGIC_KEYWORDS[asset_name],
+                STRATEGIC_PATTERNS[asset_name]
             )
 
             if value:
                 self.csv_row[asset_config["column"]] = value
-                print("    {} = {}% -> Col[{}] ({})".format(
-                    asset_name, value, asset_config["column"], method
-                ))
+                if self.verbose:
+                    asset_lines.append("    {} = {}% -> Col[{}] ({})".format(
+                        asset_name, value, asset_config["column"], method
+                    ))
             else:
-                print("    {} = NOT FOUND (kept as NA)".format(asset_name))
+                asset_lines.append("    {} = NOT FOUND (kept as NA)".format(asset_name))
 
+        if asset_lines:
+            print("\n".join(asset_lines))
         print("[OK] Strategic allocation extracted")
 
-    def _extract_hybrid(self, text, keywords, specific_patterns):
+    def _extract_hybrid(self, text, text_lower, sentences, keywords, specific_patterns):
         """
         Hybrid extraction helper method
 
-        STEP 1: Try specific patterns first
+        STEP 1: Try specific patterns first (pre-compiled, see STRATEGIC_PATTERNS/STRATEGIC_KEYWORDS)
         STEP 2: Fall back to sentence-based keyword matching with proximity check
+                (text and sentences are lowercased once by the caller and shared across assets)
         """
         # STEP 1: Try specific patterns (most accurate)
-        for pattern in specific_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for prefix, pattern in specific_patterns:
+            # Cheap substring check before running the regex
+            if prefix not in text_lower:
+                continue
+            match = pattern.search(text)
             if match:
                 value = match.group(1)
                 # Support decimals and allow 0%
@@ -216,34 +461,39 @@ class CompensswissScraper:
                     return value, "pattern"
 
         # STEP 2: Sentence-based fallback with proximity check
-        # Split by periods only (keep newlines as part of sentences)
-        sentences = re.split(r'\.(?:\s|$)', text)
-
         for sentence in sentences:
+            # Only the first percentage of a sentence is used (support decimal percentages), so a
+            # sentence without one, or whose value fails the sanity check, can be skipped up front
+            pct_match = PERCENT_RE.search(sentence)
+            if not pct_match:
+                continue
+            value = pct_match.group(1)
+            if not 0 <= float(value) <= 50:
+                continue
+            pct_pos = pct_match.start()
+
             # Check if any keyword appears in this sentence
             for keyword in keywords:
-                keyword_match = re.search(keyword, sentence, re.IGNORECASE)
-                if keyword_match:
-                    # Support decimal percentages
-                    pct_match = re.search(r'(\d+(?:\.\d+)?)%', sentence)
-                    if pct_match:
-                        value = pct_match.group(1)
-
-                        # Proximity check - keyword and percentage within 15 words
-                        keyword_pos = keyword_match.start()
-                        pct_pos = pct_match.start()
-
-                        # Extract text between keyword and percentage
-                        start_pos = min(keyword_pos, pct_pos)
-                        end_pos = max(keyword_pos, pct_pos)
-                        between_text = sentence[start_pos:end_pos]
-
-                        # Count words in between
-                        word_count = len(between_text.split())
-
-                        # Only accept if within 15 words AND valid range
-                        if word_count <= 15 and 0 <= float(value) <= 50:
-                            return value, "sentence+proximity"
+                if isinstance(keyword, str):
+                    keyword_pos = sentence.find(keyword)
+                else:
+                    keyword_match = keyword.search(sentence)
+                    keyword_pos = keyword_match.start() if keyword_match else -1
+                if keyword_pos < 0:
+                    continue
+
+                # Proximity check - keyword and percentage within 15 words
+                # Extract text between keyword and percentage
+                start_pos = min(keyword_pos, pct_pos)
+                end_pos = max(keyword_pos, pct_pos)
+                between_text = sentence[start_pos:end_pos]
+
+                # Count words in between (splitting stops one past the limit, long gaps are not tokenized)
+                word_count = len(between_text.split(None, PROXIMITY_MAX_WORDS + 1))
+
+                # Only accept if within 15 words
+                if word_count <= PROXIMITY_MAX_WORDS:
+                    return value, "sentence+proximity"
 
         return None, "not found"
 
@@ -255,7 +505,7 @@ class CompensswissScraper:
 
         # Handle "latest" keyword
         if year == "latest":
-            year = datetime.datetime.now().year
+            year = datetime.date.today().year
         else:
             year = int(year)
 
@@ -263,6 +513,7 @@ class CompensswissScraper:
         print("  CHEF COMPENSWISS DATA SCRAPER - {}".format(year))
         print("="*70)
 
+        completed = False
         try:
             # Setup
             self.setup_driver()
@@ -280,23 +531,43 @@ class CompensswissScraper:
             print("  SCRAPING COMPLETE")
             print("="*70)
 
+            completed = True
             return self.csv_row
 
         finally:
-            self.close()
+            # The browser of a failed run may be broken, so it is never kept open
+            self.close(keep_open=completed)
 
-    def close(self):
-        """Close browser"""
+    def close(self, keep_open=True):
+        """Close browser (or keep it open for the next run when keep_alive and keep_open are set)"""
         if self.driver:
+            if self.keep_alive and keep_open:
+                CompensswissScraper._cached_driver = self.driver
+                CompensswissScraper._cached_headless = self.headless
+                self.driver = None
+                print("\n[OK] Browser kept open for the next run")
+                return
             self.driver.quit()
             print("\n[OK] Browser closed")
 
+    @classmethod
+    def quit_cached_driver(cls):
+        """Close the browser kept open by keep_alive runs"""
+        if cls._cached_driver:
+            _quit_driver(cls._cached_driver)
+            cls._cached_driver = None
+            print("\n[OK] Browser closed")
+
     def save_to_excel(self, year=None):
         """Save data to Excel and create ZIP archive per runbook requirements"""
         if year is None:
-            year = self.csv_row[0] if self.csv_row[0] != "" else datetime.datetime.now().year
+            year = self.csv_row[0] if self.csv_row[0] != "" else datetime.date.today().year
+
+        if config.OUTPUT_FORMAT not in ("xlsx", "csv"):
+            raise ValueError('OUTPUT_FORMAT must be "xlsx" or "csv", got {!r}'.format(config.OUTPUT_FORMAT))
+        write_csv = config.OUTPUT_FORMAT == "csv"
 
-        print("\n[6] Saving to Excel...")
+        print("\n[6] Saving output files ({})...".format(config.OUTPUT_FORMAT))
 
         # Create reports directory structure
         base_dir = r"C:\Users\Mark Castro\Documents\CHEF – COMPENSWISS"
@@ -311,14 +582,12 @@ class CompensswissScraper:
         latest_dir = os.path.join(reports_dir, "latest")
         os.makedirs(latest_dir, exist_ok=True)
 
-        # File names per runbook: DATASET_DATA_YYYYMMDD.xls
-        data_filename = "{}_DATA_{}.xls".format(config.DATASET_NAME, timestamp)
-        meta_filename = "{}_META_{}.xls".format(config.DATASET_NAME, timestamp)
+        # File names per runbook: DATASET_DATA_YYYYMMDD.xls (.csv when OUTPUT_FORMAT is "csv")
+        extension = "csv" if write_csv else "xls"
+        data_filename = "{}_DATA_{}.{}".format(config.DATASET_NAME, timestamp, extension)
+        meta_filename = "{}_META_{}.{}".format(config.DATASET_NAME, timestamp, extension)
         zip_filename = "{}_{}.zip".format(config.DATASET_NAME, timestamp)
 
-        # Create DataFrame for DATA file
-        df_data = pd.DataFrame([config.CSV_HEADERS, config.CSV_ROW2_HEADERS, self.csv_row])
-
         # Create DataFrame for METADATA file
         df_meta = self.create_metadata()
 
@@ -327,15 +596,40 @@ class CompensswissScraper:
         meta_path_ts = os.path.join(timestamp_dir, meta_filename)
         zip_path_ts = os.path.join(timestamp_dir, zip_filename)
 
-        df_data.to_excel(data_path_ts, index=False, header=False, engine='openpyxl')
-        df_meta.to_excel(meta_path_ts, index=False, header=True, engine='openpyxl')
+        # Files are rendered in memory once, then written to disk and into the ZIP
+        # (the ZIP no longer reads the files back)
+        if write_csv:
+            data_buffer = io.StringIO()
+            csv.writer(data_buffer, lineterminator="\n").writerows(
+                (config.CSV_HEADERS, config.CSV_ROW2_HEADERS, self.csv_row)
+            )
+            data_bytes = data_buffer.getvalue().encode("utf-8")
+            meta_bytes = df_meta.to_csv(index=False, lineterminator="\n").encode("utf-8")
+        else:
+            # DATA file: three plain rows streamed straight to a write-only workbook
+            wb_data = Workbook(write_only=True)
+            ws_data = wb_data.create_sheet("Sheet1")
+            ws_data.append(config.CSV_HEADERS)
+            ws_data.append(config.CSV_ROW2_HEADERS)
+            ws_data.append(self.csv_row)
+            data_buffer = io.BytesIO()
+            wb_data.save(data_buffer)
+            meta_buffer = io.BytesIO()
+            df_meta.to_excel(meta_buffer, index=False, header=True, engine='openpyxl')
+            data_bytes = data_buffer.getvalue()
+            meta_bytes = meta_buffer.getvalue()
+
+        with open(data_path_ts, 'wb') as f:
+            f.write(data_bytes)
+        with open(meta_path_ts, 'wb') as f:
+            f.write(meta_bytes)
         print("[OK] Created DATA file: {}".format(data_filename))
         print("[OK] Created META file: {} (32 rows)".format(meta_filename))
 
         # Create ZIP archive
         with zipfile.ZipFile(zip_path_ts, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            zipf.write(data_path_ts, data_filename)
-            zipf.write(meta_path_ts, meta_filename)
+            zipf.writestr(data_filename, data_bytes)
+            zipf.writestr(meta_filename, meta_bytes)
         print("[OK] Created ZIP archive: {}".format(zip_filename))
 
         # Save to latest folder (overwrite)
@@ -343,9 +637,9 @@ class CompensswissScraper:
         meta_path_latest = os.path.join(latest_dir, meta_filename)
         zip_path_latest = os.path.join(latest_dir, zip_filename)
 
-        shutil.copy2(data_path_ts, data_path_latest)
-        shutil.copy2(meta_path_ts, meta_path_latest)
-        shutil.copy2(zip_path_ts, zip_path_latest)
+        _publish_file(data_path_ts, data_path_latest)
+        _publish_file(meta_path_ts, meta_path_latest)
+        _publish_file(zip_path_ts, zip_path_latest)
         print("[OK] Copied to latest folder")
 
         return zip_path_ts, zip_path_latest
@@ -354,79 +648,27 @@ class CompensswissScraper:
         """Create METADATA file structure matching the sample format"""
         print("\n[7] Generating metadata...")
 
-        metadata_rows = []
-
-        # Generate metadata for each column (1-32, skipping column 0 which is the year)
-        for col_idx in range(1, 33):
-            code = config.CSV_HEADERS[col_idx]
-            description = config.CSV_ROW2_HEADERS[col_idx]
-
-            # Extract code mnemonic (everything before @, then remove .A.1 suffix if present)
-            code_mnemonic = code.split('@')[0] if '@' in code else code
-            # Remove .A.1 suffix
-            if code_mnemonic.endswith('.A.1'):
-                code_mnemonic = code_mnemonic[:-4]
-
-            # Determine if this is performance data (1-27) or strategic allocation (28-32)
-            if col_idx <= 27:
-                # Performance data
-                metadata_type = config.METADATA_PERFORMANCE.copy()
-            else:
-                # Strategic allocation data
-                metadata_type = config.METADATA_STRATEGIC.copy()
-
-            # Build complete metadata row
-            row = {
-                "CODE": code,
-                "CODE_MNEMONIC": code_mnemonic,
-                "DESCRIPTION": description,
-                "FREQUENCY": config.METADATA_COMMON["FREQUENCY"],
-                "MULTIPLIER": metadata_type["MULTIPLIER"],
-                "AGGREGATION_TYPE": config.METADATA_COMMON["AGGREGATION_TYPE"],
-                "UNIT_TYPE": metadata_type["UNIT_TYPE"],
-                "DATA_TYPE": metadata_type["DATA_TYPE"],
-                "DATA_UNIT": metadata_type["DATA_UNIT"],
-                "SEASONALLY_ADJUSTED": config.METADATA_COMMON["SEASONALLY_ADJUSTED"],
-                "ANNUALIZED": config.METADATA_COMMON["ANNUALIZED"],
-                "STATE": config.METADATA_COMMON["STATE"],
-                "PROVIDER_MEASURE_URL": metadata_type["PROVIDER_MEASURE_URL"],
-                "PROVIDER": config.METADATA_COMMON["PROVIDER"],
-                "SOURCE": config.METADATA_COMMON["SOURCE"],
-                "SOURCE_DESCRIPTION": config.METADATA_COMMON["SOURCE_DESCRIPTION"],
-                "COUNTRY": config.METADATA_COMMON["COUNTRY"],
-                "DATASET": config.METADATA_COMMON["DATASET"]
-            }
-
-            metadata_rows.append(row)
-
-        df = pd.DataFrame(metadata_rows)
-        print("[OK] Generated {} metadata rows".format(len(metadata_rows)))
+        # Built once per process (the inputs are read-only config), copied so callers can modify it
+        df = _build_metadata_frame().copy()
+        print("[OK] Generated {} metadata rows".format(len(df)))
 
         return df
 
     def display_summary(self):
         """Display summary of extracted data"""
-        print("\n" + "="*70)
-        print("  DATA SUMMARY")
-        print("="*70)
-        print("\nYear: {}".format(self.csv_row[0]))
-        print("\n--- Performance Data ---")
-        print("  Money market investments: {}".format(self.csv_row[1]))
-        print("  Swiss francs bonds: {}".format(self.csv_row[3]))
-        print("  Foreign currency bonds: {}".format(self.csv_row[4]))
-        print("  Equities: {}".format(self.csv_row[11]))
-        print("  Real estate: {}".format(self.csv_row[15]))
-        print("  Gold: {}".format(self.csv_row[20]))
-        print("  Market portfolio: {}".format(self.csv_row[22]))
-        print("  Currency hedging: {}".format(self.csv_row[23]))
-        print("  Market portfolio after hedging: {}".format(self.csv_row[26]))
-        print("\n--- Strategic Allocation ---")
-        print("  Foreign currency bonds: {}%".format(self.csv_row[28]))
-        print("  Equities: {}%".format(self.csv_row[29]))
-        print("  Bonds in CHF: {}%".format(self.csv_row[30]))
-        print("  Real estate: {}%".format(self.csv_row[31]))
-        print("  Precious metals: {}%".format(self.csv_row[32]))
-        print("="*70 + "\n")
+        # Build the whole report and write it with a single print
+        lines = [
+            "\n" + "="*70,
+            "  DATA SUMMARY",
+            "="*70,
+            "\nYear: {}".format(self.csv_row[0]),
+            "\n--- Performance Data ---",
+        ]
+        lines.extend("  {}: {}".format(label, self.csv_row[col]) for label, col in SUMMARY_PERFORMANCE_COLUMNS)
+        lines.append("\n--- Strategic Allocation ---")
+        lines.extend("  {}: {}%".format(label, self.csv_row[col]) for label, col in SUMMARY_STRATEGIC_COLUMNS)
+        lines.append("="*70 + "\n")
+        print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -441,15 +683,19 @@ if __name__ == "__main__":
     # Create scraper - uses settings from config
     scraper = CompensswissScraper()
 
-    # Run scraping
-    scraper.run(year=year)
+    try:
+        # Run scraping
+        scraper.run(year=year)
 
-    # Display summary
-    scraper.display_summary()
+        # Display summary
+        scraper.display_summary()
 
-    # Save to Excel and create ZIP
-    zip_timestamp, zip_latest = scraper.save_to_excel()
+        # Save to Excel and create ZIP
+        zip_timestamp, zip_latest = scraper.save_to_excel()
 
-    print("\n[DONE] ZIP archives created:")
-    print("  Timestamp: {}".format(zip_timestamp))
-    print("  Latest: {}".format(zip_latest))
+        print("\n[DONE] ZIP archives created:")
+        print("  Timestamp: {}".format(zip_timestamp))
+        print("  Latest: {}".format(zip_latest))
+    finally:
+        # A single CLI run has no later run to reuse the browser (KEEP_BROWSER_OPEN)
+        CompensswissScraper.quit_cached_driver()